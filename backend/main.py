@@ -1,16 +1,27 @@
 # backend/main.py
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
+import queue
 import sqlite3
-from typing import Any, Dict, List, Tuple
-from datetime import datetime
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
 from collections import Counter
 import re
 
-from fastapi import FastAPI, Query
+import anyio
+from fastapi import FastAPI, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+
+try:
+  import orjson
+except ImportError:  # optionnel : repli sur le module json standard
+  orjson = None
 
 # ----------------------------------------------------------------------
 # Config / DB helpers
@@ -21,41 +32,308 @@ DB_PATH = os.environ.get(
     os.path.join(os.path.dirname(__file__), "..", "ao.db")
 )
 
+# Nombre max de connexions SQLite gardées ouvertes entre deux requêtes
+# (au moins 1 : 0 bloquerait /api/tenders et rendrait le pool illimité)
+DB_POOL_SIZE = max(1, int(os.environ.get("AO_DB_POOL_SIZE", "8")))
+
+# Journal des recherches : écrit par lots (toutes les N secondes ou dès
+# que N entrées sont en attente) plutôt qu'un INSERT + commit par requête
+SEARCH_LOG_FLUSH_SECONDS = 0.5
+SEARCH_LOG_BATCH_SIZE = 100
+
+# Le catalogue des portails change rarement : /api/portals est servi depuis
+# un cache mémoire de courte durée (et validé par ETag côté navigateur)
+PORTALS_CACHE_TTL_SECONDS = 60
 
-def _dict_factory(cursor: sqlite3.Cursor, row: Tuple[Any, ...]) -> Dict[str, Any]:
-  return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+# /api/tenders est envoyé en flux, par lots de N lignes lues dans SQLite
+TENDERS_STREAM_BATCH = 256
+
+# Clé de tri de /api/tenders (published_at vide = NULL). L'index
+# ix_tenders_published_sort porte exactement cette expression : toute
+# modification doit rester identique des deux côtés.
+_TENDERS_SORT_EXPR = (
+    "CASE WHEN published_at IS NOT NULL AND published_at <> '' "
+    "THEN published_at END"
+)
 
+# Séparateurs des colonnes multi-valeurs (catégories, mots-clés détectés)
+_MULTI_VALUE_SEP_RE = re.compile(r"[;,|]")
 
-def get_db() -> sqlite3.Connection:
-  con = sqlite3.connect(DB_PATH)
-  con.row_factory = _dict_factory
+# ----------------------------------------------------------------------
+# Requêtes SQL fixes
+# ----------------------------------------------------------------------
+# Chaînes constantes : chaque connexion du pool garde les requêtes déjà
+# préparées dans son cache (cached_statements), indexé par le texte exact.
+
+# searched_at est horodaté par SQLite (UTC, même format que les lignes
+# historiques : 2025-11-10T13:45:00). L'INSERT fournit l'expression
+# explicitement car les tables existantes n'ont pas de DEFAULT.
+_SEARCH_LOG_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now')"
+
+_SQL_CREATE_SEARCH_LOGS = f"""
+    CREATE TABLE IF NOT EXISTS search_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        searched_at TEXT NOT NULL DEFAULT ({_SEARCH_LOG_NOW}),
+        country TEXT,
+        portal_code TEXT,
+        q TEXT,
+        limit_requested INTEGER,
+        results_count INTEGER
+    )
+"""
+
+_SQL_INSERT_SEARCH_LOG = f"""
+    INSERT INTO search_logs (
+        searched_at,
+        country,
+        portal_code,
+        q,
+        limit_requested,
+        results_count
+    )
+    VALUES ({_SEARCH_LOG_NOW}, ?, ?, ?, ?, ?)
+"""
+
+_SQL_LIST_SEARCH_LOGS = """
+    SELECT
+        id,
+        searched_at,
+        country,
+        portal_code,
+        q,
+        limit_requested,
+        results_count
+    FROM search_logs
+    ORDER BY searched_at DESC, id DESC
+    LIMIT ?
+"""
+
+_SQL_CREATE_TENDERS_SORT_INDEX = f"""
+    CREATE INDEX IF NOT EXISTS ix_tenders_published_sort
+    ON tenders ({_TENDERS_SORT_EXPR}, id)
+"""
+
+_SQL_LIST_PORTALS = """
+    SELECT code, name, country, region, base_url, api_type, is_active
+    FROM source_portals
+"""
+
+# Taille du cache de requêtes préparées par connexion (défaut sqlite3 : 128)
+_DB_CACHED_STATEMENTS = 512
+
+
+def _json_dumps(content: Any) -> bytes:
+  """JSON compact en UTF-8 : orjson (C) si installé, sinon json standard."""
+  if orjson is not None:
+      return orjson.dumps(content)
+  return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+  """Réponse JSON par défaut de l'app, sérialisée via _json_dumps."""
+
+  def render(self, content: Any) -> bytes:
+      return _json_dumps(content)
+
+
+def _fetch_dicts(cur: sqlite3.Cursor) -> List[Dict[str, Any]]:
+  """
+  Lit toutes les lignes du curseur sous forme de dicts.
+  Les noms de colonnes sont extraits une seule fois de cursor.description,
+  et non à chaque ligne comme le ferait un row_factory Python.
+  """
+  cols = [c[0] for c in cur.description]
+  return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+
+# Pool de connexions : évite un sqlite3.connect() par requête et garde le
+# cache de pages SQLite chaud d'une requête à l'autre.
+_DB_POOL: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=DB_POOL_SIZE)
+
+
+# Réglages appliqués une seule fois par connexion, à sa création (aucun
+# n'écrit dans le fichier : une base en lecture seule reste utilisable) :
+# - synchronous=NORMAL : pas de double fsync à chaque commit (sûr en WAL)
+# - cache / mmap plus larges pour garder les pages chaudes de tenders
+_DB_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -64000;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+
+def _connect() -> sqlite3.Connection:
+  # check_same_thread=False : les endpoints sync tournent dans le threadpool,
+  # une connexion rendue au pool peut donc être reprise par un autre thread.
+  con = sqlite3.connect(
+      DB_PATH,
+      check_same_thread=False,
+      cached_statements=_DB_CACHED_STATEMENTS,
+  )
+  con.executescript(_DB_PRAGMAS)
   return con
 
 
+@contextmanager
+def get_db() -> Iterator[sqlite3.Connection]:
+  """
+  Emprunte une connexion au pool (ou en ouvre une nouvelle s'il est vide),
+  commit / rollback en sortie, puis la rend au pool.
+  """
+  try:
+      con = _DB_POOL.get_nowait()
+  except queue.Empty:
+      con = _connect()
+  try:
+      with con:
+          yield con
+  finally:
+      try:
+          _DB_POOL.put_nowait(con)
+      except queue.Full:
+          con.close()
+
+
+# Travail SQLite déporté en thread par les endpoints async : au plus autant
+# de threads que de connexions dans le pool.
+_DB_THREAD_LIMITER = anyio.CapacityLimiter(DB_POOL_SIZE)
+
+
+def close_db_pool() -> None:
+  """Ferme toutes les connexions inactives du pool."""
+  while True:
+      try:
+          con = _DB_POOL.get_nowait()
+      except queue.Empty:
+          break
+      con.close()
+
+
+def _enable_wal(con: sqlite3.Connection) -> None:
+  """
+  Passe la base en mode WAL : l'INSERT dans search_logs ne bloque plus les
+  lectures de tenders. Le mode est stocké dans le fichier, une fois suffit.
+  """
+  con.execute("PRAGMA journal_mode = WAL")
+
+
 def _ensure_search_logs_table(con: sqlite3.Connection) -> None:
   """
   Crée la table search_logs si elle n'existe pas encore.
   Cette table sert à journaliser chaque appel à /api/tenders.
   """
-  con.execute(
-      """
-      CREATE TABLE IF NOT EXISTS search_logs (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          searched_at TEXT NOT NULL,
-          country TEXT,
-          portal_code TEXT,
-          q TEXT,
-          limit_requested INTEGER,
-          results_count INTEGER
+  con.execute(_SQL_CREATE_SEARCH_LOGS)
+
+
+def _ensure_tenders_indexes(con: sqlite3.Connection) -> None:
+  """
+  Index sur la clé de tri de /api/tenders : SQLite lit les lignes déjà
+  triées et s'arrête au LIMIT, au lieu de trier toute la table.
+  """
+  con.execute(_SQL_CREATE_TENDERS_SORT_INDEX)
+
+
+def _init_schema() -> None:
+  """
+  DDL exécuté une seule fois au démarrage, jamais sur le chemin des requêtes.
+  Chaque étape est indépendante : une base sans table tenders (ou en lecture
+  seule) ne doit pas empêcher l'API de démarrer.
+  """
+  for ensure in (_enable_wal, _ensure_search_logs_table, _ensure_tenders_indexes):
+      try:
+          with get_db() as con:
+              ensure(con)
+      except sqlite3.Error:
+          pass
+
+
+_SEARCH_LOG_QUEUE: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+
+
+def _log_search(
+  country: str | None,
+  portal_code: str | None,
+  q: str | None,
+  limit: int,
+  results_count: int,
+) -> None:
+  """
+  Met une recherche en file d'attente pour search_logs.
+  L'écriture réelle est faite par _flush_search_logs.
+  """
+  _SEARCH_LOG_QUEUE.put_nowait(
+      (
+          country.strip() if isinstance(country, str) and country.strip() else None,
+          portal_code.strip() if isinstance(portal_code, str) and portal_code.strip() else None,
+          q.strip() if isinstance(q, str) and q.strip() else None,
+          limit,
+          results_count,
       )
-      """
   )
+  if _SEARCH_LOG_QUEUE.qsize() >= SEARCH_LOG_BATCH_SIZE:
+      _flush_search_logs()
+
+
+def _flush_search_logs() -> None:
+  """
+  Vide la file d'attente et insère toutes les recherches en une seule
+  transaction (un seul commit pour tout le lot).
+  """
+  rows: List[Tuple[Any, ...]] = []
+  while True:
+      try:
+          rows.append(_SEARCH_LOG_QUEUE.get_nowait())
+      except queue.Empty:
+          break
+  if not rows:
+      return
+
+  try:
+      with get_db() as con:
+          try:
+              con.executemany(_SQL_INSERT_SEARCH_LOG, rows)
+          except sqlite3.OperationalError:
+              # Table absente (création au démarrage échouée) : on la crée
+              # ici et on retente une fois
+              _ensure_search_logs_table(con)
+              con.executemany(_SQL_INSERT_SEARCH_LOG, rows)
+  except Exception:
+      # On ne casse pas l'API si la journalisation échoue
+      pass
+
+
+async def _search_logs_flusher() -> None:
+  while True:
+      await asyncio.sleep(SEARCH_LOG_FLUSH_SECONDS)
+      await asyncio.to_thread(_flush_search_logs)
 
 # ----------------------------------------------------------------------
 # App
 # ----------------------------------------------------------------------
 
-app = FastAPI(title="AO Collector", version="1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+  _init_schema()
+
+  flusher = asyncio.create_task(_search_logs_flusher())
+  yield
+  flusher.cancel()
+  try:
+      await flusher
+  except asyncio.CancelledError:
+      pass
+  _flush_search_logs()
+  close_db_pool()
+
+
+app = FastAPI(
+  title="AO Collector",
+  version="1.0",
+  lifespan=lifespan,
+  default_response_class=FastJSONResponse,
+)
 
 # CORS: on autorise le front Codespaces/Vite
 app.add_middleware(
@@ -93,8 +371,43 @@ def health():
 # ----------------------------------------------------------------------
 
 
+def _query_portals(only_active: bool, country: str | None) -> List[Dict[str, Any]]:
+  sql = _SQL_LIST_PORTALS
+  where: List[str] = []
+  params: List[Any] = []
+
+  if only_active:
+      where.append("is_active = 1")
+  if country:
+      where.append("UPPER(country) = UPPER(?)")
+      params.append(country)
+
+  if where:
+      sql += " WHERE " + " AND ".join(where)
+
+  sql += " ORDER BY CASE WHEN is_active=1 THEN 0 ELSE 1 END, UPPER(name)"
+
+  with get_db() as con:
+      rows = _fetch_dicts(con.execute(sql, params))
+  return rows
+
+
+_PORTALS_CACHE: Dict[Tuple[bool, str | None], Tuple[float, List[Dict[str, Any]], str]] = {}
+_PORTALS_CACHE_MAX_KEYS = 64
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+  header = request.headers.get("if-none-match")
+  if not header:
+      return False
+  candidates = [t.strip().removeprefix("W/") for t in header.split(",")]
+  return etag in candidates or "*" in candidates
+
+
 @app.get("/api/portals")
 def list_portals(
+  request: Request,
+  response: Response,
   only_active: bool = Query(False, description="Limiter aux portails actifs"),
   country: str | None = Query(
       None, description="Filtrer par code pays (CA, US, EU, etc.)"
@@ -111,27 +424,31 @@ def list_portals(
     - base_url
     - api_type
     - is_active
-  """
-  sql = """
-      SELECT code, name, country, region, base_url, api_type, is_active
-      FROM source_portals
-  """
-  where: List[str] = []
-  params: List[Any] = []
 
-  if only_active:
-      where.append("is_active = 1")
+  Résultat mis en cache PORTALS_CACHE_TTL_SECONDS secondes par
+  (only_active, country) ; renvoie 304 si If-None-Match correspond.
+  """
   if country and country.strip() and country.upper() not in ("ALL", "TOUS"):
-      where.append("UPPER(country) = UPPER(?)")
-      params.append(country.strip())
-
-  if where:
-      sql += " WHERE " + " AND ".join(where)
-
-  sql += " ORDER BY CASE WHEN is_active=1 THEN 0 ELSE 1 END, UPPER(name)"
-
-  with get_db() as con:
-      rows = con.execute(sql, params).fetchall()
+      country = country.strip()
+  else:
+      country = None
+
+  key = (only_active, country.upper() if country else None)
+  cached = _PORTALS_CACHE.get(key)
+  if cached is None or time.monotonic() - cached[0] > PORTALS_CACHE_TTL_SECONDS:
+      rows = _query_portals(only_active, country)
+      etag = '"' + hashlib.sha1(
+          json.dumps(rows, sort_keys=True, default=str).encode("utf-8")
+      ).hexdigest() + '"'
+      if len(_PORTALS_CACHE) >= _PORTALS_CACHE_MAX_KEYS:
+          _PORTALS_CACHE.clear()
+      cached = (time.monotonic(), rows, etag)
+      _PORTALS_CACHE[key] = cached
+
+  _, rows, etag = cached
+  if _etag_matches(request, etag):
+      return Response(status_code=304, headers={"ETag": etag})
+  response.headers["ETag"] = etag
   return rows
 
 # ----------------------------------------------------------------------
@@ -198,12 +515,9 @@ def _build_tenders_sql_and_params(
       sql += " AND " + " AND ".join(where)
 
   # Tri: published_at si présent, puis id desc
-  sql += """
+  sql += f"""
       ORDER BY
-          CASE
-              WHEN published_at IS NOT NULL AND published_at <> ''
-              THEN published_at
-          END DESC,
+          {_TENDERS_SORT_EXPR} DESC,
           id DESC
   """
 
@@ -214,8 +528,108 @@ def _build_tenders_sql_and_params(
   return sql, params
 
 
+def _map_tender_row(row: Dict[str, Any]) -> Dict[str, Any]:
+  """Mapping colonnes BD -> JSON propre pour le frontend."""
+  return {
+      "id": row.get("id"),
+
+      # Source brute (code, plateforme...)
+      "source": row.get("source") or row.get("plateforme"),
+
+      # Portail lisible / code
+      "portal": row.get("portal") or row.get("portal_name") or row.get("portail"),
+
+      # Pays / région
+      "country": row.get("country") or row.get("pays"),
+      "region": row.get("region"),
+
+      # Acheteur
+      "buyer": row.get("buyer") or row.get("acheteur"),
+
+      # Titre + lien
+      "title": row.get("title") or row.get("titre"),
+      "url": row.get("url") or row.get("lien"),
+
+      # Dates
+      "published_at": row.get("published_at") or row.get("date_publication"),
+      "closing_at": row.get("closing_at") or row.get("date_cloture"),
+
+      # Budget
+      "budget": row.get("budget"),
+
+      # Catégorie lisible
+      "category": (
+          row.get("category")
+          or row.get("categorie_principale")
+          or row.get("categories_unspsc")
+      ),
+
+      # Mots-clés détectés
+      "matched_keywords": row.get("matched_keywords")
+      or row.get("mots_cles_detectes"),
+
+      # Score de pertinence
+      "score": row.get("score")
+      or row.get("score_pertinence"),
+  }
+
+
+def _stream_tenders(
+  sql: str,
+  params: List[Any],
+  country: str | None,
+  portal_code: str | None,
+  q: str | None,
+  limit: int,
+) -> Iterator[bytes]:
+  """
+  Produit le tableau JSON de /api/tenders par lots de TENDERS_STREAM_BATCH
+  lignes : la réponse n'est jamais entièrement matérialisée en mémoire.
+
+  La requête SQL est exécutée avant le premier yield ; la connexion reste
+  empruntée au pool jusqu'à la fin (ou l'abandon) du flux.
+  """
+  count = 0
+  with get_db() as con:
+      cur = con.execute(sql, params)
+      cols = [c[0] for c in cur.description]
+      try:
+          yield b"["
+          for batch in iter(lambda: cur.fetchmany(TENDERS_STREAM_BATCH), []):
+              mapped = [_map_tender_row(dict(zip(cols, row))) for row in batch]
+              yield (b"," if count else b"") + _json_dumps(mapped)[1:-1]
+              count += len(batch)
+          yield b"]"
+      finally:
+          # --- Journalisation de la recherche (écrite par lots dans search_logs) ---
+          _log_search(country, portal_code, q, limit, count)
+
+
+async def _iterate_in_db_threads(
+  first: bytes,
+  chunks: Iterator[bytes],
+) -> AsyncIterator[bytes]:
+  """
+  Itère un générateur SQLite synchrone depuis la boucle d'événements :
+  chaque lot est lu dans un thread borné par _DB_THREAD_LIMITER.
+  """
+  try:
+      yield first
+      while True:
+          chunk = await anyio.to_thread.run_sync(
+              next, chunks, None, limiter=_DB_THREAD_LIMITER
+          )
+          if chunk is None:
+              break
+          yield chunk
+  finally:
+      # Rend la connexion au pool même si le client abandonne le flux
+      with anyio.CancelScope(shield=True):
+          await anyio.to_thread.run_sync(chunks.close, limiter=_DB_THREAD_LIMITER)
+
+
 @app.get("/api/tenders")
-def list_tenders(
+async def list_tenders(
   country: str | None = Query(
       None, alias="country", description="Code pays (CA, US, EU, etc.)"
   ),
@@ -258,87 +672,14 @@ def list_tenders(
 
   sql, params = _build_tenders_sql_and_params(country, portal_code, q, limit)
 
-  with get_db() as con:
-      rows = con.execute(sql, params).fetchall()
-
-      # --- Journalisation de la recherche dans search_logs ---
-      try:
-          _ensure_search_logs_table(con)
-          con.execute(
-              """
-              INSERT INTO search_logs (
-                  searched_at,
-                  country,
-                  portal_code,
-                  q,
-                  limit_requested,
-                  results_count
-              )
-              VALUES (?, ?, ?, ?, ?, ?)
-              """,
-              (
-                  datetime.utcnow().isoformat(timespec="seconds"),
-                  country.strip() if isinstance(country, str) and country.strip() else None,
-                  portal_code.strip() if isinstance(portal_code, str) and portal_code.strip() else None,
-                  q.strip() if isinstance(q, str) and q.strip() else None,
-                  limit,
-                  len(rows),
-              ),
-          )
-          # le commit sera fait par le context manager "with"
-      except Exception:
-          # On ne casse pas l'API si la journalisation échoue
-          pass
-
-  # Mapping colonnes BD -> JSON propre pour le frontend
-  mapped: List[Dict[str, Any]] = []
-  for row in rows:
-      mapped.append(
-          {
-              "id": row.get("id"),
-
-              # Source brute (code, plateforme...)
-              "source": row.get("source") or row.get("plateforme"),
-
-              # Portail lisible / code
-              "portal": row.get("portal") or row.get("portal_name") or row.get("portail"),
-
-              # Pays / région
-              "country": row.get("country") or row.get("pays"),
-              "region": row.get("region"),
-
-              # Acheteur
-              "buyer": row.get("buyer") or row.get("acheteur"),
-
-              # Titre + lien
-              "title": row.get("title") or row.get("titre"),
-              "url": row.get("url") or row.get("lien"),
-
-              # Dates
-              "published_at": row.get("published_at") or row.get("date_publication"),
-              "closing_at": row.get("closing_at") or row.get("date_cloture"),
-
-              # Budget
-              "budget": row.get("budget"),
-
-              # Catégorie lisible
-              "category": (
-                  row.get("category")
-                  or row.get("categorie_principale")
-                  or row.get("categories_unspsc")
-              ),
-
-              # Mots-clés détectés
-              "matched_keywords": row.get("matched_keywords")
-              or row.get("mots_cles_detectes"),
-
-              # Score de pertinence
-              "score": row.get("score")
-              or row.get("score_pertinence"),
-          }
-      )
-
-  return mapped
+  # Le premier next() exécute la requête : une erreur SQL donne encore une
+  # réponse 500 classique, avant l'envoi des en-têtes.
+  chunks = _stream_tenders(sql, params, country, portal_code, q, limit)
+  first = await anyio.to_thread.run_sync(next, chunks, limiter=_DB_THREAD_LIMITER)
+  return StreamingResponse(
+      _iterate_in_db_threads(first, chunks),
+      media_type="application/json",
+  )
 
 # ----------------------------------------------------------------------
 # /api/search-logs – journal des recherches
@@ -358,24 +699,17 @@ def list_search_logs(
   Retourne les recherches effectuées récemment sur /api/tenders.
   Utile pour diagnostiquer, et aussi base pour des rapports.
   """
+  # Les recherches encore en file d'attente doivent apparaître dans le journal
+  _flush_search_logs()
+
   with get_db() as con:
-      _ensure_search_logs_table(con)
-      rows = con.execute(
-          """
-          SELECT
-              id,
-              searched_at,
-              country,
-              portal_code,
-              q,
-              limit_requested,
-              results_count
-          FROM search_logs
-          ORDER BY searched_at DESC, id DESC
-          LIMIT ?
-          """,
-          (limit,),
-      ).fetchall()
+      try:
+          cur = con.execute(_SQL_LIST_SEARCH_LOGS, (limit,))
+      except sqlite3.OperationalError:
+          # Même reprise que _flush_search_logs si la table n'existe pas
+          _ensure_search_logs_table(con)
+          cur = con.execute(_SQL_LIST_SEARCH_LOGS, (limit,))
+      rows = _fetch_dicts(cur)
 
   return rows
 
@@ -425,7 +759,7 @@ def report_by_categories(
   sql, params = _build_tenders_sql_and_params(country, portal_code, q, limit=max_rows)
 
   with get_db() as con:
-      rows = con.execute(sql, params).fetchall()
+      rows = _fetch_dicts(con.execute(sql, params))
 
   counter: Counter[str] = Counter()
   for row in rows:
@@ -438,7 +772,7 @@ def report_by_categories(
           continue
 
       # On découpe sur ; , |
-      parts = re.split(r"[;,|]", str(raw))
+      parts = _MULTI_VALUE_SEP_RE.split(str(raw))
       for part in parts:
           name = part.strip()
           if not name:
@@ -503,7 +837,7 @@ def report_by_keywords(
   sql, params = _build_tenders_sql_and_params(country, portal_code, q, limit=max_rows)
 
   with get_db() as con:
-      rows = con.execute(sql, params).fetchall()
+      rows = _fetch_dicts(con.execute(sql, params))
 
   counter: Counter[str] = Counter()
   for row in rows:
@@ -511,7 +845,7 @@ def report_by_keywords(
       if not raw:
           continue
 
-      parts = re.split(r"[;,|]", str(raw))
+      parts = _MULTI_VALUE_SEP_RE.split(str(raw))
       for part in parts:
           term = part.strip()
           if not term:
@@ -1,7 +1,9 @@
 import csv
 import datetime as dt
 import io
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 
 import requests
@@ -80,6 +82,19 @@ def log(msg: str) -> None:
     print(msg, file=sys.stdout, flush=True)
 
 
+# Session HTTP partagée : connexions keep-alive réutilisées entre les
+# fichiers SEAO (même hôte) ; requests négocie gzip/deflate par défaut.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "ao-ti-collector/1.0"})
+
+
+# Préfixe ISO (2025-11-10, 2025-11-10T13:45:00Z) : cas de loin le plus fréquent
+_ISO_DATE_PREFIX_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+# Formats fréquents : 2025-11-10, 2025/11/10
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d")
+
+
 def parse_date(value: str) -> Optional[dt.date]:
     """Parse une date en provenance des différentes sources."""
     if not value:
@@ -87,8 +102,15 @@ def parse_date(value: str) -> Optional[dt.date]:
 
     value = value.strip()
 
-    # Formats fréquents : 2025-11-10, 2025-11-10T13:45:00Z, 2025/11/10
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d"):
+    # Chemin rapide : préfixe ISO strict, sans passer par strptime
+    m = _ISO_DATE_PREFIX_RE.match(value)
+    if m:
+        try:
+            return dt.date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        except ValueError:
+            pass
+
+    for fmt in _DATE_FORMATS:
         try:
             return dt.datetime.strptime(value[:10], fmt).date()
         except ValueError:
@@ -121,7 +143,7 @@ def get_seao_resources() -> List[Tuple[str, str]]:
     On ne charge pas ici, on filtre ensuite par fenêtre de dates.
     """
     try:
-        resp = requests.get(
+        resp = SESSION.get(
             SEAO_PACKAGE_URL,
             params={"id": SEAO_PACKAGE_ID},
             timeout=30,
@@ -229,6 +251,12 @@ def normalize_seao_release(release: dict) -> Optional[dict]:
     }
 
 
+def fetch_seao_file(url: str) -> dict:
+    resp = SESSION.get(url, timeout=120)
+    resp.raise_for_status()
+    return resp.json()
+
+
 def load_seao(window_start: dt.date, window_end: dt.date) -> List[dict]:
     resources = get_seao_resources()
     if not resources:
@@ -251,26 +279,33 @@ def load_seao(window_start: dt.date, window_end: dt.date) -> List[dict]:
     all_rows: List[dict] = []
     total_releases = 0
 
-    for name, url in selected:
-        try:
-            resp = requests.get(url, timeout=120)
-            resp.raise_for_status()
-            data = resp.json()
-        except Exception as e:
-            log(f"SEAO fichier {name} -> ERREUR chargement ({e})")
-            continue
+    # Un fichier d'avance : le téléchargement du suivant se fait en
+    # arrière-plan pendant la normalisation du fichier courant.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(fetch_seao_file, selected[0][1]) if selected else None
 
-        releases = data.get("releases") or []
-        total_releases += len(releases)
-        log(f"SEAO fichier {name} -> {len(releases)} enregistrements (releases)")
+        for i, (name, _) in enumerate(selected):
+            current = pending
+            if i + 1 < len(selected):
+                pending = pool.submit(fetch_seao_file, selected[i + 1][1])
 
-        for rel in releases:
-            row = normalize_seao_release(rel)
-            if not row:
+            try:
+                data = current.result()
+            except Exception as e:
+                log(f"SEAO fichier {name} -> ERREUR chargement ({e})")
                 continue
-            pub_date = row["published_at"]
-            if window_start <= pub_date <= window_end:
-                all_rows.append(row)
+
+            releases = data.get("releases") or []
+            total_releases += len(releases)
+            log(f"SEAO fichier {name} -> {len(releases)} enregistrements (releases)")
+
+            for rel in releases:
+                row = normalize_seao_release(rel)
+                if not row:
+                    continue
+                pub_date = row["published_at"]
+                if window_start <= pub_date <= window_end:
+                    all_rows.append(row)
 
     log(f"SEAO brut total -> {total_releases} enregistrements scannés")
     log(f"SEAO -> {len(all_rows)} lignes retenues dans la fenêtre")
@@ -282,65 +317,68 @@ def load_seao(window_start: dt.date, window_end: dt.date) -> List[dict]:
 # =========================
 
 
+def pick_column(row: List[str], cols: Tuple[int, ...]) -> str:
+    """Première valeur non vide parmi les colonnes candidates (par index)."""
+    for i in cols:
+        if i < len(row):
+            value = row[i].strip()
+            if value:
+                return value
+    return ""
+
+
 def load_canadabuys(window_start: dt.date, window_end: dt.date) -> List[dict]:
     try:
-        resp = requests.get(CANADABUYS_CSV_URL, timeout=60)
+        resp = SESSION.get(CANADABUYS_CSV_URL, timeout=60)
         resp.raise_for_status()
     except Exception as e:
         log(f"CanadaBuys -> ERREUR chargement CSV ({e})")
         return []
 
     content = resp.content.decode("utf-8-sig", errors="ignore")
-    reader = csv.DictReader(io.StringIO(content))
+    reader = csv.reader(io.StringIO(content))
+
+    # Les noms de colonnes varient selon les versions du fichier :
+    # on résout une seule fois les index des colonnes candidates.
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+
+    def columns(*names: str) -> Tuple[int, ...]:
+        return tuple(index[n] for n in names if n in index)
+
+    title_cols = columns("Tender Notice Title")
+    date_cols = columns("Publication Date", "PublicationDate", "Date de publication")
+    buyer_cols = columns("Organization Name", "Procuring Organization", "Organization")
+    url_cols = columns("Tender Notice Link", "URL du préavis d'appel d'offres", "URL")
+    summary_cols = columns("Description", "Summary")
+    ocid_cols = columns("Notice ID", "Reference Number")
 
     rows: List[dict] = []
     for r in reader:
-        title = (r.get("Tender Notice Title") or "").strip()
+        title = pick_column(r, title_cols)
         if not title:
             continue
 
-        date_str = (
-            r.get("Publication Date")
-            or r.get("PublicationDate")
-            or r.get("Date de publication")
-            or ""
-        )
-        pub_date = parse_date(date_str)
+        pub_date = parse_date(pick_column(r, date_cols))
         if not pub_date:
             continue
         if not (window_start <= pub_date <= window_end):
             continue
 
-        buyer = (
-            r.get("Organization Name")
-            or r.get("Procuring Organization")
-            or r.get("Organization")
-            or ""
-        ).strip()
-
-        url = (
-            r.get("Tender Notice Link")
-            or r.get("URL du préavis d'appel d'offres")
-            or r.get("URL")
-            or ""
-        ).strip()
-
-        summary = (r.get("Description") or r.get("Summary") or "").strip()
-
         row = {
             "source": "CanadaBuys",
             "title": title,
-            "url": url,
+            "url": pick_column(r, url_cols),
             "published_at": pub_date,
             "country": "CA",
             "region": "CA-FED",
             "portal_name": "CanadaBuys",
             "matched_keywords": "",
-            "raw_summary": summary,
+            "raw_summary": pick_column(r, summary_cols),
             "source_domain": "canadabuys.canada.ca",
             "confidence": 0.9,
-            "ocid": (r.get("Notice ID") or r.get("Reference Number") or "").strip(),
-            "buyer": buyer,
+            "ocid": pick_column(r, ocid_cols),
+            "buyer": pick_column(r, buyer_cols),
         }
         rows.append(row)
 